@@ -20,27 +20,69 @@ for model inference on Hugging Face Spaces.
 """
 
 import os
+
+from depth_anything_3.utils.memory import configure_cuda_allocator
+
+# Must run before torch initializes its CUDA caching allocator
+configure_cuda_allocator()
+
+# Set DA3_SPACES_GPU=0 to run the same entry point outside ZeroGPU Spaces
+USE_SPACES_GPU = os.environ.get("DA3_SPACES_GPU", "1") == "1"
+if USE_SPACES_GPU:
+    # spaces must be imported before torch
+    import spaces
+
+    # Leave allocator headroom on the shared ZeroGPU device; inherited by GPU workers
+    os.environ.setdefault("DA3_CUDA_MEMORY_FRACTION", "0.85")
+
 from depth_anything_3.app.gradio_app import DepthAnything3App
 from depth_anything_3.app.modules.model_inference import ModelInference
+from depth_anything_3.utils.logger import logger
+
+# Upper bound for a single GPU lease, in seconds
+MAX_GPU_DURATION = 120
+
+
+def _estimate_scene_duration(target_dir, infer_gs=False, **kwargs):
+    """
+    Estimate the GPU time (seconds) needed to reconstruct one scene.
+
+    Scales with the number of input frames; 3DGS video rendering is
+    long-running, so it reserves the full window.
+    """
+    if infer_gs:
+        return MAX_GPU_DURATION
+    images_dir = os.path.join(target_dir, "images")
+    num_frames = len(os.listdir(images_dir)) if os.path.isdir(images_dir) else 0
+    return 10 + 3 * num_frames
+
+
+def _run_inference_duration(self, target_dir, *args, **kwargs):
+    return min(MAX_GPU_DURATION, _estimate_scene_duration(target_dir, **kwargs))
+
 
 # Apply @spaces.GPU decorator to run_inference method
 # This ensures GPU operations happen in isolated subprocess
-# Model loading and inference will occur in GPU subprocess, not main process
-original_run_inference = ModelInference.run_inference
+# Model loading and inference will occur in GPU subprocess, not main process.
+# On the class, run_inference is a plain function, so the decorated result
+# still binds `self` normally and no extra wrapper frame is added per call.
+# Leases are sized per call from the input, so short jobs free the GPU sooner.
+if USE_SPACES_GPU:
+    ModelInference.run_inference = spaces.GPU(duration=_run_inference_duration)(
+        ModelInference.run_inference
+    )
 
-def gpu_run_inference(self, *args, **kwargs):
+
+def _warmup():
     """
-    GPU-accelerated inference with Spaces decorator.
-    
-    This function runs in a GPU subprocess where:
-    - Model is loaded and moved to GPU (safe)
-    - CUDA operations are allowed
-    - All CUDA tensors are moved to CPU before return (for pickle safety)
+    Load model weights into the main-process CPU cache before serving.
+
+    GPU workers are forked from the main process, so they inherit the
+    already-loaded weights and only pay the move to CUDA per call instead
+    of reloading from disk. Loading to CPU does not initialize CUDA.
     """
-    return original_run_inference(self, *args, **kwargs)
+    ModelInference().initialize_model(device="cpu")
 
-# Replace the original method with the GPU-decorated version
-ModelInference.run_inference = gpu_run_inference
 
 # Initialize and launch the app
 if __name__ == "__main__":
@@ -48,11 +90,9 @@ if __name__ == "__main__":
     model_dir = os.environ.get("DA3_MODEL_DIR", "depth-anything/DA3NESTED-GIANT-LARGE")
     workspace_dir = os.environ.get("DA3_WORKSPACE_DIR", "workspace/gradio")
     gallery_dir = os.environ.get("DA3_GALLERY_DIR", "workspace/gallery")
-    
-    # Create directories if they don't exist
-    os.makedirs(workspace_dir, exist_ok=True)
-    os.makedirs(gallery_dir, exist_ok=True)
-    
+
+    # Workspace and gallery directories are created on first write
+
     # Initialize the app
     app = DepthAnything3App(
         model_dir=model_dir,
@@ -60,16 +100,21 @@ if __name__ == "__main__":
         gallery_dir=gallery_dir
     )
     
+    # Keep weights resident so each GPU call skips the disk load
+    _warmup()
+
     # Examples disabled - no caching
     cache_examples = False
     
-    # Launch with Spaces-friendly settings
-    print("🚀 Launching Hashtee Lab 3D Modeling on Hugging Face Spaces...")
-    print(f"📦 Model Directory: {model_dir}")
-    print(f"📁 Workspace Directory: {workspace_dir}")
-    print(f"🖼️  Gallery Directory: {gallery_dir}")
-    print(f"💾 Cache Examples: {cache_examples} (disabled)")
-    
+    # Launch with Spaces-friendly settings (banner emitted as a single log record)
+    logger.info(
+        "🚀 Launching Hashtee Lab 3D Modeling on Hugging Face Spaces...\n"
+        f"📦 Model Directory: {model_dir}\n"
+        f"📁 Workspace Directory: {workspace_dir}\n"
+        f"🖼️  Gallery Directory: {gallery_dir}\n"
+        f"💾 Cache Examples: {cache_examples} (disabled)"
+    )
+
     # Launch with minimal, Spaces-compatible configuration
     # Some parameters may cause routing issues, so we use minimal config
     app.launch(
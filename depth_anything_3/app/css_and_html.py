@@ -20,24 +20,23 @@ This module contains all the CSS styles and HTML content blocks
 used in the Gradio interface.
 """
 
+import re
+
 # CSS Styles for the Gradio interface
 GRADIO_CSS = """
-/* Add Font Awesome CDN with all styles including brands and colors */
-@import url('https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css');
+/* Inline SVG icons from ICON_SPRITE_HTML, sized and colored like font glyphs */
+.icon {
+    width: 1em;
+    height: 1em;
+    fill: currentColor;
+    vertical-align: -0.125em;
+}
 
 /* Add custom styles for colored icons */
 .fa-color-blue {
     color: #3b82f6;
 }
 
-.fa-color-purple {
-    color: #8b5cf6;
-}
-
-.fa-color-cyan {
-    color: #06b6d4;
-}
-
 .fa-color-green {
     color: #10b981;
 }
@@ -59,142 +58,102 @@ GRADIO_CSS = """
     border-radius: 50px;
     font-weight: 500;
     transition: all 0.3s ease;
+    background: var(--link-bg);
+    color: var(--link-fg);
+    backdrop-filter: var(--link-backdrop);
+    border: 1px solid var(--link-border);
 }
 
-/* Dark mode tech theme */
-@media (prefers-color-scheme: dark) {
-    html, body {
-        background: #1e293b;
-        color: #ffffff;
-    }
-
-    .gradio-container {
-        background: #1e293b;
-        color: #ffffff;
-    }
-
-    .link-btn {
-        background: rgba(255, 255, 255, 0.2);
-        color: white;
-        backdrop-filter: blur(10px);
-        border: 1px solid rgba(255, 255, 255, 0.3);
-    }
-
-    .link-btn:hover {
-        background: rgba(255, 255, 255, 0.3);
-        transform: translateY(-2px);
-        box-shadow: 0 8px 25px rgba(0, 0, 0, 0.2);
-    }
-
-    .tech-bg {
-        background: linear-gradient(135deg, #0f172a, #1e293b); /* Darker colors */
-        position: relative;
-        overflow: hidden;
-    }
-
-    .tech-bg::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        bottom: 0;
-        background:
-            radial-gradient(circle at 20% 80%, rgba(59, 130, 246, 0.15) 0%, transparent 50%), /* Reduced opacity */
-            radial-gradient(circle at 80% 20%, rgba(139, 92, 246, 0.15) 0%, transparent 50%), /* Reduced opacity */
-            radial-gradient(circle at 40% 40%, rgba(18, 194, 233, 0.1) 0%, transparent 50%); /* Reduced opacity */
-        animation: techPulse 8s ease-in-out infinite;
-    }
-
-    .gradio-container .panel,
-    .gradio-container .block,
-    .gradio-container .form {
-        background: rgba(0, 0, 0, 0.3);
-        border: 1px solid rgba(59, 130, 246, 0.2);
-        border-radius: 10px;
-    }
-
-    .gradio-container * {
-        color: #ffffff;
-    }
-
-    .gradio-container label {
-        color: #e0e0e0;
-    }
-
-    .gradio-container .markdown {
-        color: #e0e0e0;
-    }
+/* Adaptive tech theme: colors are variables, rules are declared once */
+:root {
+    --bg: #eff6ff;  /* Light blue background */
+    --fg: #0f172a;  /* Charcoal text */
+    --fg-muted: #334155;
+    --panel-bg: rgba(255, 255, 255, 0.9);
+    --panel-border: rgba(30, 64, 175, 0.2);
+    --panel-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+    --link-bg: rgba(30, 64, 175, 0.15);  /* Corporate blue with opacity */
+    --link-fg: #0f172a;
+    --link-border: rgba(30, 64, 175, 0.3);
+    --link-backdrop: none;
+    --link-hover-bg: rgba(30, 64, 175, 0.25);
+    --link-hover-shadow: rgba(30, 64, 175, 0.2);
+    --tech-gradient: linear-gradient(135deg, rgba(59, 130, 246, 0.1) 0%, rgba(139, 92, 246, 0.1) 100%);
+    --tech-glow-1: rgba(59, 130, 246, 0.1);
+    --tech-glow-2: rgba(139, 92, 246, 0.1);
+    --tech-glow-3: rgba(18, 194, 233, 0.08);
 }
 
-/* Light mode tech theme */
-@media (prefers-color-scheme: light) {
-    html, body {
-        background: #eff6ff;  /* Light blue background */
-        color: #0f172a;  /* Charcoal text */
-    }
-
-    .gradio-container {
-        background: #eff6ff;  /* Light blue background */
-        color: #0f172a;  /* Charcoal text */
-    }
-
-    .tech-bg {
-        background: linear-gradient(135deg, #eff6ff, #dbeafe);  /* Light blue gradient */
-        position: relative;
-        overflow: hidden;
-    }
-
-    .link-btn {
-        background: rgba(30, 64, 175, 0.15);  /* Corporate blue with opacity */
-        color: #0f172a;  /* Charcoal text */
-        border: 1px solid rgba(30, 64, 175, 0.3);
-    }
-
-    .link-btn:hover {
-        background: rgba(30, 64, 175, 0.25);
-        transform: translateY(-2px);
-        box-shadow: 0 8px 25px rgba(30, 64, 175, 0.2);
-    }
-
-    .tech-bg::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        bottom: 0;
-        background:
-            radial-gradient(circle at 20% 80%, rgba(59, 130, 246, 0.1) 0%, transparent 50%),
-            radial-gradient(circle at 80% 20%, rgba(139, 92, 246, 0.1) 0%, transparent 50%),
-            radial-gradient(circle at 40% 40%, rgba(18, 194, 233, 0.08) 0%, transparent 50%);
-        animation: techPulse 8s ease-in-out infinite;
+@media (prefers-color-scheme: dark) {
+    :root {
+        --bg: #1e293b;
+        --fg: #ffffff;
+        --fg-muted: #e0e0e0;
+        --panel-bg: rgba(0, 0, 0, 0.3);
+        --panel-border: rgba(59, 130, 246, 0.2);
+        --panel-shadow: none;
+        --link-bg: rgba(255, 255, 255, 0.2);
+        --link-fg: white;
+        --link-border: rgba(255, 255, 255, 0.3);
+        --link-backdrop: blur(10px);
+        --link-hover-bg: rgba(255, 255, 255, 0.3);
+        --link-hover-shadow: rgba(0, 0, 0, 0.2);
+        --tech-gradient: linear-gradient(135deg, #0f172a, #1e293b);  /* Darker colors */
+        --tech-glow-1: rgba(59, 130, 246, 0.15);  /* Reduced opacity */
+        --tech-glow-2: rgba(139, 92, 246, 0.15);
+        --tech-glow-3: rgba(18, 194, 233, 0.1);
     }
+}
 
-    .gradio-container .panel,
-    .gradio-container .block,
-    .gradio-container .form {
-        background: rgba(255, 255, 255, 0.9);
-        border: 1px solid rgba(30, 64, 175, 0.2);
-        border-radius: 10px;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-    }
+html, body,
+.gradio-container {
+    background: var(--bg);
+    color: var(--fg);
+}
 
-    .gradio-container * {
-        color: #0f172a;
-    }
+.link-btn:hover {
+    background: var(--link-hover-bg);
+    transform: translateY(-2px);
+    box-shadow: 0 8px 25px var(--link-hover-shadow);
+}
 
-    .gradio-container label {
-        color: #334155;
-    }
+.tech-bg {
+    /* !important: Gradio's theme sets container backgrounds that must not win */
+    background: var(--tech-gradient) !important;
+    position: relative;
+    overflow: hidden;
+}
 
-    .gradio-container .markdown {
-        color: #334155;
-    }
+.tech-bg::before {
+    content: '';
+    position: absolute;
+    top: 0;
+    left: 0;
+    right: 0;
+    bottom: 0;
+    background:
+        radial-gradient(circle at 20% 80%, var(--tech-glow-1) 0%, transparent 50%),
+        radial-gradient(circle at 80% 20%, var(--tech-glow-2) 0%, transparent 50%),
+        radial-gradient(circle at 40% 40%, var(--tech-glow-3) 0%, transparent 50%);
 }
 
+.gradio-container .panel,
+.gradio-container .block,
+.gradio-container .form {
+    background: var(--panel-bg);
+    border: 1px solid var(--panel-border);
+    border-radius: 10px;
+    box-shadow: var(--panel-shadow);
+}
 
+.gradio-container * {
+    color: var(--fg);
+}
 
+.gradio-container label,
+.gradio-container .markdown {
+    color: var(--fg-muted);
+}
 
 @keyframes techPulse {
     0%, 100% { opacity: 0.5; }
@@ -206,86 +165,59 @@ GRADIO_CSS = """
     font-style: italic;
     font-size: 22px !important;
     background: linear-gradient(135deg, #3b82f6, #8b5cf6);
-    background-size: 400% 400%;
+    background-size: 200% 200%;
     -webkit-background-clip: text;
     background-clip: text;
     font-weight: bold !important;
     color: transparent !important;
     text-align: center !important;
-    animation: techGradient 3s ease infinite;
-}
-
-@keyframes techGradient {
-    0% { background-position: 0% 50%; }
-    50% { background-position: 100% 50%; }
-    100% { background-position: 0% 50%; }
-}
-
-@keyframes metricPulse {
-    0%, 100% { background-position: 0% 50%; }
-    50% { background-position: 100% 50%; }
 }
 
-@keyframes pointcloudPulse {
+/* Shared gradient sweep for all animated gradient text */
+@keyframes bgPulse {
     0%, 100% { background-position: 0% 50%; }
     50% { background-position: 100% 50%; }
 }
 
-@keyframes camerasPulse {
-    0%, 100% { background-position: 0% 50%; }
-    50% { background-position: 100% 50%; }
-}
-
-@keyframes gaussiansPulse {
-    0%, 100% { background-position: 0% 50%; }
-    50% { background-position: 100% 50%; }
-}
-
-/* Special colors for key terms - Global styles */
-.metric-text {
-    background: linear-gradient(45deg, #ff6b6b, #ff8e53, #ff6b6b);
-    background-size: 200% 200%;
-    -webkit-background-clip: text;
-    background-clip: text;
-    color: transparent !important;
-    animation: metricPulse 2s ease-in-out infinite;
-    font-weight: 700;
-    text-shadow: 0 0 10px rgba(255, 107, 107, 0.5);
-}
+/* Infinite animations only run for users who have not asked for reduced motion */
+@media (prefers-reduced-motion: no-preference) {
+    .tech-bg::before {
+        animation: techPulse 8s ease-in-out infinite;
+    }
 
-.pointcloud-text {
-    background: linear-gradient(45deg, #4ecdc4, #44a08d, #4ecdc4);
-    background-size: 200% 200%;
-    -webkit-background-clip: text;
-    background-clip: text;
-    color: transparent !important;
-    animation: pointcloudPulse 2.5s ease-in-out infinite;
-    font-weight: 700;
-    text-shadow: 0 0 10px rgba(78, 205, 196, 0.5);
-}
+    .custom-log *,
+    .header-title {
+        animation: bgPulse 3s ease infinite;
+    }
 
-.cameras-text {
-    background: linear-gradient(45deg, #667eea, #764ba2, #667eea);
-    background-size: 200% 200%;
-    -webkit-background-clip: text;
-    background-clip: text;
-    color: transparent !important;
-    animation: camerasPulse 3s ease-in-out infinite;
-    font-weight: 700;
-    text-shadow: 0 0 10px rgba(102, 126, 234, 0.5);
+    .metric-text,
+    .pointcloud-text,
+    .cameras-text,
+    .gaussians-text {
+        animation: bgPulse var(--dur) ease-in-out infinite;
+    }
 }
 
+/* Special colors for key terms - Global styles. One animated gradient-text
+   rule; each variant only sets its color stops, glow and pulse duration */
+.metric-text,
+.pointcloud-text,
+.cameras-text,
 .gaussians-text {
-    background: linear-gradient(45deg, #f093fb, #f5576c, #f093fb);
+    background: linear-gradient(45deg, var(--c1), var(--c2), var(--c1));
     background-size: 200% 200%;
     -webkit-background-clip: text;
     background-clip: text;
     color: transparent !important;
-    animation: gaussiansPulse 2.2s ease-in-out infinite;
     font-weight: 700;
-    text-shadow: 0 0 10px rgba(240, 147, 251, 0.5);
+    text-shadow: 0 0 10px var(--glow);
 }
 
+.metric-text { --c1: #ff6b6b; --c2: #ff8e53; --glow: rgba(255, 107, 107, 0.5); --dur: 2s; }
+.pointcloud-text { --c1: #4ecdc4; --c2: #44a08d; --glow: rgba(78, 205, 196, 0.5); --dur: 2.5s; }
+.cameras-text { --c1: #667eea; --c2: #764ba2; --glow: rgba(102, 126, 234, 0.5); --dur: 3s; }
+.gaussians-text { --c1: #f093fb; --c2: #f5576c; --glow: rgba(240, 147, 251, 0.5); --dur: 2.2s; }
+
 .example-log * {
     font-style: italic;
     font-size: 16px !important;
@@ -358,86 +290,98 @@ GRADIO_CSS = """
 """
 
 
-def get_header_html(logo_base64=None):
+# Only the Font Awesome Free 6.4.0 solid glyphs the UI uses, inlined as an SVG
+# sprite instead of importing the whole icon font from a CDN.
+# Icons: CC BY 4.0, https://fontawesome.com/license/free (c) 2023 Fonticons, Inc.
+ICON_SPRITE_HTML = """
+<svg xmlns="http://www.w3.org/2000/svg" style="display: none;">
+    <symbol id="fa-trophy" viewBox="0 0 576 512"><path d="M400 0H176c-26.5 0-48.1 21.8-47.1 48.2c.2 5.3 .4 10.6 .7 15.8H24C10.7 64 0 74.7 0 88c0 92.6 33.5 157 78.5 200.7c44.3 43.1 98.3 64.8 138.1 75.8c23.4 6.5 39.4 26 39.4 45.6c0 20.9-17 37.9-37.9 37.9H192c-17.7 0-32 14.3-32 32s14.3 32 32 32H384c17.7 0 32-14.3 32-32s-14.3-32-32-32H357.9C337 448 320 431 320 410.1c0-19.6 15.9-39.2 39.4-45.6c39.9-11 93.9-32.7 138.2-75.8C542.5 245 576 180.6 576 88c0-13.3-10.7-24-24-24H446.4c.3-5.2 .5-10.4 .7-15.8C448.1 21.8 426.5 0 400 0zM48.9 112h84.4c9.1 90.1 29.2 150.3 51.9 190.6c-24.9-11-50.8-26.5-73.2-48.3c-32-31.1-58-76-63-142.3zM464.1 254.3c-22.4 21.8-48.3 37.3-73.2 48.3c22.7-40.3 42.8-100.5 51.9-190.6h84.4c-5.1 66.3-31.1 111.2-63 142.3z"/></symbol>
+    <symbol id="fa-flask" viewBox="0 0 448 512"><path d="M288 0H160 128C110.3 0 96 14.3 96 32s14.3 32 32 32V196.8c0 11.8-3.3 23.5-9.5 33.5L10.3 406.2C3.6 417.2 0 429.7 0 442.6C0 480.9 31.1 512 69.4 512H378.6c38.3 0 69.4-31.1 69.4-69.4c0-12.8-3.6-25.4-10.3-36.4L329.5 230.4c-6.2-10.1-9.5-21.7-9.5-33.5V64c17.7 0 32-14.3 32-32s-14.3-32-32-32H288zM192 196.8V64h64V196.8c0 23.7 6.6 46.9 19 67.1L309.5 320h-171L173 263.9c12.4-20.2 19-43.4 19-67.1z"/></symbol>
+    <symbol id="fa-history" viewBox="0 0 512 512"><path d="M75 75L41 41C25.9 25.9 0 36.6 0 57.9V168c0 13.3 10.7 24 24 24H134.1c21.4 0 32.1-25.9 17-41l-30.8-30.8C155 85.5 203 64 256 64c106 0 192 86 192 192s-86 192-192 192c-40.8 0-78.6-12.7-109.7-34.4c-14.5-10.1-34.4-6.6-44.6 7.9s-6.6 34.4 7.9 44.6C151.2 495 201.7 512 256 512c141.4 0 256-114.6 256-256S397.4 0 256 0C185.3 0 121.3 28.7 75 75zm181 53c-13.3 0-24 10.7-24 24V256c0 6.4 2.5 12.5 7 17l72 72c9.4 9.4 24.6 9.4 33.9 0s9.4-24.6 0-33.9l-65-65V152c0-13.3-10.7-24-24-24z"/></symbol>
+    <symbol id="fa-code-branch" viewBox="0 0 448 512"><path d="M80 104a24 24 0 1 0 0-48 24 24 0 1 0 0 48zm80-24c0 32.8-19.7 61-48 73.3v87.8c18.8-10.9 40.7-17.1 64-17.1h96c35.3 0 64-28.7 64-64v-6.7C307.7 141 288 112.8 288 80c0-44.2 35.8-80 80-80s80 35.8 80 80c0 32.8-19.7 61-48 73.3V160c0 70.7-57.3 128-128 128H176c-35.3 0-64 28.7-64 64v6.7c28.3 12.3 48 40.5 48 73.3c0 44.2-35.8 80-80 80s-80-35.8-80-80c0-32.8 19.7-61 48-73.3V352 153.3C19.7 141 0 112.8 0 80C0 35.8 35.8 0 80 0s80 35.8 80 80zm232 0a24 24 0 1 0 -48 0 24 24 0 1 0 48 0zM80 456a24 24 0 1 0 0-48 24 24 0 1 0 0 48z"/></symbol>
+    <symbol id="fa-triangle-exclamation" viewBox="0 0 512 512"><path d="M256 32c14.2 0 27.3 7.5 34.5 19.8l216 368c7.3 12.4 7.3 27.7 .2 40.1S486.3 480 472 480H40c-14.3 0-27.6-7.7-34.7-20.1s-7-27.8 .2-40.1l216-368C228.7 39.5 241.8 32 256 32zm0 128c-13.3 0-24 10.7-24 24V296c0 13.3 10.7 24 24 24s24-10.7 24-24V184c0-13.3-10.7-24-24-24zm32 224a32 32 0 1 0 -64 0 32 32 0 1 0 64 0z"/></symbol>
+</svg>
+"""
+
+
+def icon_html(name, classes="", style=""):
     """
-    Generate the main header HTML with logo and title.
+    Reference an icon from ICON_SPRITE_HTML.
 
     Args:
-        logo_base64 (str, optional): Base64 encoded logo image
+        name (str): Symbol id, e.g. "fa-trophy"
+        classes (str, optional): Extra CSS classes, e.g. "fa-color-yellow"
+        style (str, optional): Inline CSS for the icon
 
     Returns:
-        str: HTML string for the header
+        str: HTML string for the inline icon
+    """
+    return (
+        f'<svg class="icon {classes}" style="{style}" aria-hidden="true">'
+        f'<use href="#{name}"/></svg>'
+    )
+
+
+def _minify_css(css):
     """
-    return """
+    Strip comments and redundant whitespace/semicolons from a CSS string.
+
+    Whitespace is dropped around braces, semicolons, commas and child
+    combinators, and after colons; it is kept before colons so descendant
+    selectors like ``.a :hover`` keep their meaning.
+
+    Args:
+        css (str): Raw CSS source
+
+    Returns:
+        str: Minified CSS
+    """
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+
+# Minified once at import; the stylesheet never changes at runtime
+GRADIO_CSS_MIN = _minify_css(GRADIO_CSS)
+
+
+# Header with title
+HEADER_HTML = ICON_SPRITE_HTML + """
     <div class="tech-bg" style="text-align: center; margin-bottom: 5px; padding: 40px 20px; border-radius: 15px; position: relative; overflow: hidden;">
         <div style="position: relative; z-index: 2;">
-            <h1 style="margin: 0; font-size: 3.5em; font-weight: 700;
+            <h1 class="header-title" style="margin: 0; font-size: 3.5em; font-weight: 700;
                 background: linear-gradient(135deg, #3b82f6, #8b5cf6);
                 background-size: 400% 400%;
                 -webkit-background-clip: text;
                 background-clip: text;
                 color: transparent;
-                animation: techGradient 3s ease infinite;
                 text-shadow: 0 0 30px rgba(59, 130, 246, 0.5);
                 letter-spacing: 2px;">
                 Hashtee Lab 3D modeling
             </h1>
         </div>
     </div>
-
-    <style>
-        /* Ensure tech-bg class is properly applied in dark mode */
-        @media (prefers-color-scheme: dark) {
-            .header-subtitle {
-                color: #cbd5e1;
-            }
-            /* Increase priority to ensure background color is properly applied */
-            .tech-bg {
-                background: linear-gradient(135deg, #0f172a, #1e293b) !important;
-            }
-        }
-
-        @media (prefers-color-scheme: light) {
-            .header-subtitle {
-                color: #475569;
-            }
-            /* Also add explicit background color for light mode */
-            .tech-bg {
-                background: linear-gradient(135deg, rgba(59, 130, 246, 0.1) 0%, rgba(139, 92, 246, 0.1) 100%) !important;
-            }
-        }
-    </style>
-    """
-
-
-def get_description_html():
     """
-    Generate the main description and getting started HTML.
 
-    Returns:
-        str: HTML string for the description
-    """
-    return ""
 
+# Main description (currently empty)
+DESCRIPTION_HTML = ""
 
-def get_acknowledgements_html():
-    """
-    Generate the acknowledgements section HTML.
 
-    Returns:
-        str: HTML string for the acknowledgements
-    """
-    return """
+# Acknowledgements section
+ACKNOWLEDGEMENTS_HTML = """
     <div style="background: linear-gradient(135deg, rgba(59, 130, 246, 0.1) 0%, rgba(139, 92, 246, 0.1) 100%);
                 padding: 25px; border-radius: 15px; margin: 20px 0; border: 1px solid rgba(59, 130, 246, 0.2);">
         <h3 style="color: #3b82f6; margin-top: 0; text-align: center; font-size: 1.4em;">
-            <i class="fas fa-trophy fa-color-yellow" style="margin-right: 8px;"></i> Research Credits & Acknowledgments
+            """ + icon_html("fa-trophy", "fa-color-yellow", "margin-right: 8px;") + """ Research Credits & Acknowledgments
         </h3>
 
         <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 20px; margin: 15px 0;">
             <!-- Original Research Section (Left) -->
             <div style="text-align: center;">
-                <h4 style="color: #8b5cf6; margin: 10px 0;"><i class="fas fa-flask fa-color-green" style="margin-right: 8px;"></i> Original Research</h4>
+                <h4 style="color: #8b5cf6; margin: 10px 0;">""" + icon_html("fa-flask", "fa-color-green", "margin-right: 8px;") + """ Original Research</h4>
                 <p style="color: #e0e0e0; margin: 5px 0;">
                     <a href="https://depth-anything-3.github.io" target="_blank"
                        style="color: #3b82f6; text-decoration: none; font-weight: 600;">
@@ -448,7 +392,7 @@ def get_acknowledgements_html():
 
             <!-- Previous Versions Section (Right) -->
             <div style="text-align: center;">
-                <h4 style="color: #8b5cf6; margin: 10px 0;"><i class="fas fa-history fa-color-blue" style="margin-right: 8px;"></i> Previous Versions</h4>
+                <h4 style="color: #8b5cf6; margin: 10px 0;">""" + icon_html("fa-history", "fa-color-blue", "margin-right: 8px;") + """ Previous Versions</h4>
                 <div style="display: flex; flex-direction: row; gap: 15px; justify-content: center; align-items: center;">
                     <p style="color: #e0e0e0; margin: 0;">
                         <a href="https://huggingface.co/spaces/LiheYoung/Depth-Anything" target="_blank"
@@ -470,13 +414,66 @@ def get_acknowledgements_html():
         <!-- HF Demo Adapted from - Centered at the bottom of the whole block -->
         <div style="margin-top: 20px; padding-top: 15px; border-top: 1px solid rgba(59, 130, 246, 0.3); text-align: center;">
             <p style="color: #a0a0a0; font-size: 0.9em; margin: 0;">
-                <i class="fas fa-code-branch fa-color-gray" style="margin-right: 5px;"></i> HF demo adapted from <a href="https://huggingface.co/spaces/facebook/map-anything" target="_blank" style="color: inherit; text-decoration: none;">Map Anything</a>
+                """ + icon_html("fa-code-branch", "fa-color-gray", "margin-right: 5px;") + """ HF demo adapted from <a href="https://huggingface.co/spaces/facebook/map-anything" target="_blank" style="color: inherit; text-decoration: none;">Map Anything</a>
             </p>
         </div>
     </div>
     """
 
 
+def _minify_html(html):
+    """
+    Strip comments and inter-tag whitespace from a static HTML string.
+
+    Args:
+        html (str): Raw HTML source
+
+    Returns:
+        str: Minified HTML
+    """
+    html = re.sub(r"<!--.*?-->", "", html, flags=re.S)
+    html = re.sub(r"\s+", " ", html)
+    return re.sub(r">\s+<", "><", html).strip()
+
+
+# Static HTML blocks are minified once at import and served as-is
+HEADER_HTML = _minify_html(HEADER_HTML)
+ACKNOWLEDGEMENTS_HTML = _minify_html(ACKNOWLEDGEMENTS_HTML)
+
+
+def get_header_html(logo_base64=None):
+    """
+    Get the main header HTML with logo and title.
+
+    Args:
+        logo_base64 (str, optional): Unused, kept for backward compatibility
+
+    Returns:
+        str: HTML string for the header
+    """
+    return HEADER_HTML
+
+
+def get_description_html():
+    """
+    Get the main description and getting started HTML.
+
+    Returns:
+        str: HTML string for the description
+    """
+    return DESCRIPTION_HTML
+
+
+def get_acknowledgements_html():
+    """
+    Get the acknowledgements section HTML.
+
+    Returns:
+        str: HTML string for the acknowledgements
+    """
+    return ACKNOWLEDGEMENTS_HTML
+
+
 def get_gradio_theme():
     """
     Get the configured Gradio theme with adaptive tech colors.
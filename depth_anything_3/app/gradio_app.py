@@ -20,16 +20,22 @@ The original functionality has been split into modular components for better mai
 """
 
 import argparse
+import hashlib
 import os
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 import gradio as gr
 
-from depth_anything_3.app.css_and_html import GRADIO_CSS, get_gradio_theme
+from depth_anything_3.app.css_and_html import GRADIO_CSS_MIN, get_gradio_theme
 from depth_anything_3.app.modules.event_handlers import EventHandlers
 from depth_anything_3.app.modules.ui_components import UIComponents
+from depth_anything_3.app.modules.utils import ensure_dir
+from depth_anything_3.utils.memory import configure_cuda_allocator
 
-# Set environment variables
-os.environ["PYTORCH_CUDA_ALLOC_CONF"] = "expandable_segments:True"
+# Concurrency for UI-only events; GPU work runs under its own "gpu" limit of 1
+UI_CONCURRENCY_LIMIT = 8
+
+# Set environment variables (keep any allocator config chosen by the entry point)
+configure_cuda_allocator()
 
 
 class DepthAnything3App:
@@ -155,6 +161,31 @@ class DepthAnything3App:
         print("Example scene caching completed!")
         print("=" * 60 + "\n")
 
+    def _stylesheet_head(self) -> Optional[str]:
+        """
+        Write the stylesheet to the workspace and link it from the page head.
+
+        Served as a static file, the CSS is cached by the browser across page
+        loads instead of being re-sent inline with every page. The file name
+        carries a hash of its content, so the URL (and any cached copy) stays
+        valid across restarts and only changes when the stylesheet does.
+
+        Returns:
+            HTML <link> tag, or None if no workspace directory is configured
+        """
+        if not self.workspace_dir:
+            return None
+
+        css_hash = hashlib.blake2b(GRADIO_CSS_MIN.encode("utf-8")).hexdigest()[:16]
+        assets_dir = os.path.abspath(ensure_dir(os.path.join(self.workspace_dir, "assets")))
+        css_path = os.path.join(assets_dir, f"app.{css_hash}.css")
+        if not os.path.exists(css_path):
+            with open(css_path, "w", encoding="utf-8") as f:
+                f.write(GRADIO_CSS_MIN)
+
+        gr.set_static_paths(paths=[assets_dir])
+        return f'<link rel="stylesheet" href="/gradio_api/file={css_path}">'
+
     def create_app(self) -> gr.Blocks:
         """
         Create and configure the Gradio application.
@@ -162,8 +193,10 @@ class DepthAnything3App:
         Returns:
             Configured Gradio Blocks interface
         """
+        head = self._stylesheet_head()
+        css = None if head else GRADIO_CSS_MIN
 
-        with gr.Blocks(css=GRADIO_CSS, theme=get_gradio_theme()) as demo:
+        with gr.Blocks(css=css, head=head, theme=get_gradio_theme()) as demo:
             # State variables for the tabbed interface
             is_example = gr.Textbox(label="is_example", visible=False, value="None")
             processed_data_state = gr.State(value=None)
@@ -248,6 +281,7 @@ class DepthAnything3App:
                             ),
                             inputs=infer_gs,
                             outputs=[gs_trj_mode, gs_video_quality, gs_video, gs_info],
+                            concurrency_limit=UI_CONCURRENCY_LIMIT,
                         )
 
             # Set up event handlers
@@ -351,8 +385,16 @@ class DepthAnything3App:
 
         # Main reconstruction button
         submit_btn.click(
-            fn=self.event_handlers.clear_fields, inputs=[], outputs=[reconstruction_output]
-        ).then(fn=self.event_handlers.update_log, inputs=[], outputs=[log_output]).then(
+            fn=self.event_handlers.clear_fields,
+            inputs=[],
+            outputs=[reconstruction_output],
+            concurrency_limit=UI_CONCURRENCY_LIMIT,
+        ).then(
+            fn=self.event_handlers.update_log,
+            inputs=[],
+            outputs=[log_output],
+            concurrency_limit=UI_CONCURRENCY_LIMIT,
+        ).then(
             fn=self.event_handlers.gradio_demo,
             inputs=[
                 target_dir_output,
@@ -380,10 +422,14 @@ class DepthAnything3App:
                 gs_video,  # gs_video visibility
                 gs_info,  # gs_info visibility
             ],
+            # All GPU-bound handlers share one slot
+            concurrency_limit=1,
+            concurrency_id="gpu",
         ).then(
             fn=lambda: "False",
             inputs=[],
             outputs=[is_example],  # set is_example to "False"
+            concurrency_limit=UI_CONCURRENCY_LIMIT,
         )
 
         # Real-time visualization updates
@@ -403,11 +449,13 @@ class DepthAnything3App:
             fn=self.event_handlers.handle_uploads,
             inputs=[input_video, input_images, s_time_interval],
             outputs=[reconstruction_output, target_dir_output, image_gallery, log_output],
+            concurrency_limit=UI_CONCURRENCY_LIMIT,
         )
         input_images.change(
             fn=self.event_handlers.handle_uploads,
             inputs=[input_video, input_images, s_time_interval],
             outputs=[reconstruction_output, target_dir_output, image_gallery, log_output],
+            concurrency_limit=UI_CONCURRENCY_LIMIT,
         )
 
         # Image gallery click handler (for selecting first frame)
@@ -420,6 +468,7 @@ class DepthAnything3App:
         image_gallery.select(
             fn=handle_image_selection,
             outputs=[log_output, selected_image_index_state],
+            concurrency_limit=UI_CONCURRENCY_LIMIT,
         )
 
         # Select first frame handler
@@ -427,6 +476,7 @@ class DepthAnything3App:
             fn=self.event_handlers.select_first_frame,
             inputs=[image_gallery, selected_image_index_state],
             outputs=[image_gallery, log_output, selected_first_frame_state],
+            concurrency_limit=UI_CONCURRENCY_LIMIT,
         )
 
         # Navigation handlers
@@ -445,6 +495,7 @@ class DepthAnything3App:
             fn=self.event_handlers.measure,
             inputs=[processed_data_state, measure_points_state, measure_view_selector],
             outputs=[measure_image, measure_depth_image, measure_points_state, measure_text],
+            concurrency_limit=UI_CONCURRENCY_LIMIT,
         )
 
         # Example scene handlers
@@ -492,6 +543,7 @@ class DepthAnything3App:
                 fn=self.event_handlers.update_visualization,
                 inputs=viz_inputs,
                 outputs=[reconstruction_output, log_output],
+                concurrency_limit=UI_CONCURRENCY_LIMIT,
             )
 
     def _setup_navigation_handlers(
@@ -517,6 +569,7 @@ class DepthAnything3App:
                 measure_depth_image,
                 measure_points_state,
             ],
+            concurrency_limit=UI_CONCURRENCY_LIMIT,
         )
 
         next_measure_btn.click(
@@ -530,6 +583,7 @@ class DepthAnything3App:
                 measure_depth_image,
                 measure_points_state,
             ],
+            concurrency_limit=UI_CONCURRENCY_LIMIT,
         )
 
         measure_view_selector.change(
@@ -542,6 +596,7 @@ class DepthAnything3App:
             ),
             inputs=[processed_data_state, measure_view_selector],
             outputs=[measure_image, measure_depth_image, measure_points_state],
+            concurrency_limit=UI_CONCURRENCY_LIMIT,
         )
 
     def _setup_example_scene_handlers(
@@ -594,6 +649,7 @@ class DepthAnything3App:
                         measure_image,
                         measure_depth_image,
                     ],
+                    concurrency_limit=UI_CONCURRENCY_LIMIT,
                 )
 
     def launch(self, host: str = "127.0.0.1", port: int = 7860, **kwargs) -> None:
@@ -606,7 +662,7 @@ class DepthAnything3App:
             **kwargs: Additional arguments for demo.launch()
         """
         demo = self.create_app()
-        demo.queue(max_size=20).launch(
+        demo.queue(default_concurrency_limit=1, max_size=32).launch(
             show_error=True, server_name=host, server_port=port, **kwargs
         )
 
@@ -677,9 +733,7 @@ Examples:
 
     args = parser.parse_args()
 
-    # Create directories if they don't exist
-    os.makedirs(args.workspace_dir, exist_ok=True)
-    os.makedirs(args.gallery_dir, exist_ok=True)
+    # Workspace and gallery directories are created on first write
 
     # Initialize and launch the application
     app = DepthAnything3App(
@@ -25,6 +25,7 @@ from depth_anything_3.app.modules.ui_components import UIComponents
 from depth_anything_3.app.modules.utils import (
     cleanup_memory,
     create_depth_visualization,
+    ensure_dir,
     get_logo_base64,
     get_scene_info,
     save_to_gallery_func,
@@ -41,5 +42,6 @@ __all__ = [
     "save_to_gallery_func",
     "get_scene_info",
     "cleanup_memory",
+    "ensure_dir",
     "get_logo_base64",
 ]
@@ -28,6 +28,7 @@ import torch
 
 from depth_anything_3.app.modules.file_handlers import FileHandler
 from depth_anything_3.app.modules.model_inference import ModelInference
+from depth_anything_3.utils.logger import logger
 from depth_anything_3.utils.memory import cleanup_cuda_memory
 from depth_anything_3.app.modules.visualization import VisualizationHandler
 
@@ -157,7 +158,6 @@ class EventHandlers:
         gr.update,  # gs video visibility update
         gr.update,  # gs info visibility update
     ]:
-        print(f"[DEBUG] gradio_demo called with target_dir: {target_dir}")
         """
         Perform reconstruction using the already-created target_dir/images.
 
@@ -173,7 +173,7 @@ class EventHandlers:
         Returns:
             Tuple of reconstruction results
         """
-        print(f"[DEBUG] gradio_demo called with target_dir: {target_dir}")
+        logger.debug("gradio_demo called with target_dir:", target_dir)
         
         # If target_dir is None or "None", try to find the latest uploaded session
         if target_dir is None or target_dir == "None":
@@ -226,7 +226,7 @@ class EventHandlers:
                 selected_first_frame = ""  # Reset to use default order
 
         try:
-            print(f"[DEBUG] Starting reconstruction process for {target_dir}")
+            logger.debug("Starting reconstruction process for", target_dir)
             with torch.no_grad():
                 prediction, processed_data = self.model_inference.run_inference(
                     target_dir,
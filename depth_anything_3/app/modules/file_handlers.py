@@ -27,6 +27,9 @@ import cv2
 from PIL import Image
 from pillow_heif import register_heif_opener
 
+from depth_anything_3.app.modules.utils import ensure_dir
+from depth_anything_3.utils.video import extract_video_frames
+
 register_heif_opener()
 
 
@@ -60,13 +63,9 @@ class FileHandler:
 
         # Get workspace directory from environment variable or use default
         workspace_dir = os.environ.get("DA3_WORKSPACE_DIR", "gradio_workspace")
-        if not os.path.exists(workspace_dir):
-            os.makedirs(workspace_dir)
 
-        # Create input_images subdirectory
-        input_images_dir = os.path.join(workspace_dir, "input_images")
-        if not os.path.exists(input_images_dir):
-            os.makedirs(input_images_dir)
+        # Create input_images subdirectory (and the workspace) on first use
+        input_images_dir = ensure_dir(os.path.join(workspace_dir, "input_images"))
 
         # Create a unique folder name within input_images
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
@@ -167,8 +166,6 @@ class FileHandler:
         Returns:
             List of extracted frame paths
         """
-        image_paths = []
-
         if isinstance(input_video, dict) and "name" in input_video:
             video_path = input_video["name"]
         else:
@@ -176,22 +173,13 @@ class FileHandler:
 
         vs = cv2.VideoCapture(video_path)
         fps = vs.get(cv2.CAP_PROP_FPS)
+        vs.release()
         frame_interval = max(1, int(fps / s_time_interval))  # Convert FPS to frame interval
 
-        count = 0
-        video_frame_num = 0
-        while True:
-            gotit, frame = vs.read()
-            if not gotit:
-                break
-            count += 1
-            if count % frame_interval == 0:
-                image_path = os.path.join(target_dir_images, f"{video_frame_num:06}.png")
-                cv2.imwrite(image_path, frame)
-                image_paths.append(image_path)
-                video_frame_num += 1
-
-        return image_paths
+        # Keep the last frame of each interval
+        return extract_video_frames(
+            video_path, target_dir_images, frame_interval, offset=frame_interval - 1
+        )
 
     def update_gallery_on_upload(
         self,
@@ -250,9 +238,7 @@ class FileHandler:
 
         # Use fixed directory name for examples (not timestamp-based)
         workspace_dir = os.environ.get("DA3_WORKSPACE_DIR", "gradio_workspace")
-        input_images_dir = os.path.join(workspace_dir, "input_images")
-        if not os.path.exists(input_images_dir):
-            os.makedirs(input_images_dir)
+        input_images_dir = ensure_dir(os.path.join(workspace_dir, "input_images"))
 
         # Create a fixed folder name based on scene name
         target_dir = os.path.join(input_images_dir, f"example_{scene_name}")
@@ -29,12 +29,31 @@ import torch
 from depth_anything_3.api import DepthAnything3
 from depth_anything_3.utils.export.glb import export_to_glb
 from depth_anything_3.utils.export.gs import export_to_gs_video
+from depth_anything_3.utils.logger import logger
 
 
 # Global cache for model (safe in GPU subprocess with @spaces.GPU)
 # Each subprocess gets its own copy of this global variable
 _MODEL_CACHE = None
 
+# Fraction of device memory this process may claim, leaving allocator headroom
+# on shared GPUs (env: DA3_CUDA_MEMORY_FRACTION). Unset means no cap, so a
+# dedicated GPU keeps all of its memory; the Spaces entry point sets it.
+_CUDA_MEMORY_FRACTION_SET = False
+
+
+def _cuda_memory_fraction() -> Optional[float]:
+    """Return the configured per-process CUDA memory fraction, or None for no cap."""
+    value = os.environ.get("DA3_CUDA_MEMORY_FRACTION")
+    if not value:
+        return None
+    try:
+        fraction = float(value)
+    except ValueError:
+        print(f"Ignoring invalid DA3_CUDA_MEMORY_FRACTION={value!r}")
+        return None
+    return fraction if 0.0 < fraction < 1.0 else None
+
 
 class ModelInference:
     """
@@ -66,7 +85,7 @@ class ModelInference:
         Returns:
             Model instance ready for inference on specified device
         """
-        global _MODEL_CACHE
+        global _MODEL_CACHE, _CUDA_MEMORY_FRACTION_SET
         
         if _MODEL_CACHE is None:
             # First time loading in this subprocess
@@ -82,12 +101,19 @@ class ModelInference:
             _MODEL_CACHE.eval()
             print("✅ Model loaded to CPU memory (cached in subprocess)")
         
+        device = torch.device(device)
+        if device.type == "cuda" and not _CUDA_MEMORY_FRACTION_SET:
+            fraction = _cuda_memory_fraction()
+            if fraction is not None:
+                torch.cuda.set_per_process_memory_fraction(fraction)
+            _CUDA_MEMORY_FRACTION_SET = True
+
         # Move to target device for inference
-        if device != "cpu" and next(_MODEL_CACHE.parameters()).device.type != device:
+        if device.type != "cpu" and next(_MODEL_CACHE.parameters()).device.type != device.type:
             print(f"🚀 Moving model from {next(_MODEL_CACHE.parameters()).device} to {device}...")
             _MODEL_CACHE = _MODEL_CACHE.to(device)
             print(f"✅ Model ready on {device}")
-        elif device == "cpu":
+        elif device.type == "cpu":
             # Already on CPU or requested CPU
             pass
         
@@ -148,7 +174,7 @@ class ModelInference:
         ]
 
         print(f"Found {len(all_image_paths)} images")
-        print(f"All image paths: {all_image_paths}")
+        logger.debug("All image paths:", all_image_paths)
 
         # Apply first frame selection logic
         if selected_first_frame:
@@ -165,7 +191,7 @@ class ModelInference:
                     path for path in all_image_paths if path != selected_path
                 ]
                 print(f"User selected first frame: {selected_first_frame} -> {selected_path}")
-                print(f"Reordered image paths: {image_paths}")
+                logger.debug("Reordered image paths:", image_paths)
             else:
                 # Use default order if no match found
                 image_paths = all_image_paths
@@ -229,9 +255,11 @@ class ModelInference:
         # This prevents CUDA initialization in main process during unpickling
         prediction = self._move_prediction_to_cpu(prediction)
 
-        # Clean up
-        torch.cuda.empty_cache()
-
+        # No per-call empty_cache here: the caching allocator reuses the freed
+        # blocks on the next request. Cached blocks are only released by
+        # cleanup_cuda_memory, when reserved memory crosses its threshold or after
+        # an error. Under ZeroGPU that runs in the main process, where CUDA is
+        # never initialized, so it does nothing there.
         return prediction, processed_data
 
     def _save_predictions_cache(self, target_dir: str, prediction: Any) -> None:
@@ -341,7 +369,7 @@ class ModelInference:
                     tensor = getattr(gaussians, attr)
                     if isinstance(tensor, torch.Tensor) and tensor.is_cuda:
                         setattr(gaussians, attr, tensor.cpu())
-                        print(f"  ✓ Moved gaussians.{attr} to CPU")
+                        logger.debug("  ✓ Moved gaussians attribute", attr, "to CPU")
         
         # Move any tensors in aux dict to CPU
         if hasattr(prediction, 'aux') and prediction.aux is not None:
@@ -360,6 +388,6 @@ class ModelInference:
 
     def cleanup(self) -> None:
         """Clean up GPU memory."""
-        if torch.cuda.is_available():
+        if torch.cuda.is_available() and torch.cuda.is_initialized():
             torch.cuda.empty_cache()
         gc.collect()
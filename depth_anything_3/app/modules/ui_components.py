@@ -22,7 +22,7 @@ import os
 from typing import Any, Dict, List, Tuple
 import gradio as gr
 
-from depth_anything_3.app.modules.utils import get_logo_base64, get_scene_info
+from depth_anything_3.app.modules.utils import get_scene_info
 
 
 class UIComponents:
@@ -205,6 +205,8 @@ class UIComponents:
         Returns:
             Tuple of (process_res_method_dropdown, infer_gs)
         """
+        from depth_anything_3.app.css_and_html import icon_html
+
         with gr.Row():
             process_res_method_dropdown = gr.Dropdown(
                 choices=["high_res", "low_res"],
@@ -219,8 +221,9 @@ class UIComponents:
                 label="Infer 3D Gaussian Splatting",
                 value=False,
                 info=(
-                    'Enable novel view rendering from 3DGS (<i class="fas fa-triangle-exclamation '
-                    'fa-color-red"></i> requires extra processing time)'
+                    "Enable novel view rendering from 3DGS ("
+                    + icon_html("fa-triangle-exclamation", "fa-color-red")
+                    + " requires extra processing time)"
                 ),
                 scale=1,
                 visible=False,
@@ -450,9 +453,9 @@ class UIComponents:
         Returns:
             Header HTML component
         """
-        from depth_anything_3.app.css_and_html import get_header_html
+        from depth_anything_3.app.css_and_html import HEADER_HTML
 
-        return gr.HTML(get_header_html(get_logo_base64()))
+        return gr.HTML(HEADER_HTML)
 
     def create_description_section(self) -> gr.HTML:
         """
@@ -461,9 +464,9 @@ class UIComponents:
         Returns:
             Description HTML component
         """
-        from depth_anything_3.app.css_and_html import get_description_html
+        from depth_anything_3.app.css_and_html import DESCRIPTION_HTML
 
-        return gr.HTML(get_description_html())
+        return gr.HTML(DESCRIPTION_HTML)
 
     def create_acknowledgements_section(self) -> gr.HTML:
         """
@@ -472,6 +475,6 @@ class UIComponents:
         Returns:
             Acknowledgements HTML component
         """
-        from depth_anything_3.app.css_and_html import get_acknowledgements_html
+        from depth_anything_3.app.css_and_html import ACKNOWLEDGEMENTS_HTML
 
-        return gr.HTML(get_acknowledgements_html())
+        return gr.HTML(ACKNOWLEDGEMENTS_HTML)
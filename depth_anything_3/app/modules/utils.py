@@ -24,6 +24,7 @@ import json
 import os
 import shutil
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 import numpy as np
 import torch
@@ -63,6 +64,24 @@ def create_depth_visualization(depth: np.ndarray) -> Optional[np.ndarray]:
     return depth_colored
 
 
+@lru_cache(maxsize=None)
+def ensure_dir(path: str) -> str:
+    """
+    Create a long-lived directory on first use.
+
+    Cached per path, so repeated calls for the workspace and gallery roots
+    cost no filesystem syscalls after the first one.
+
+    Args:
+        path: Directory to create
+
+    Returns:
+        The same path, for chaining
+    """
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
 def save_to_gallery_func(
     target_dir: str, processed_data: Dict[int, Dict[str, Any]], gallery_name: Optional[str] = None
 ) -> Tuple[bool, str]:
@@ -79,12 +98,12 @@ def save_to_gallery_func(
     """
     try:
         # Get gallery directory from environment variable or use default
-        gallery_dir = os.environ.get(
-            "DA3_GALLERY_DIR",
-            "workspace/gallery",
+        gallery_dir = ensure_dir(
+            os.environ.get(
+                "DA3_GALLERY_DIR",
+                "workspace/gallery",
+            )
         )
-        if not os.path.exists(gallery_dir):
-            os.makedirs(gallery_dir)
 
         # Use provided name or create a unique name
         if gallery_name is None or gallery_name.strip() == "":
@@ -188,7 +207,7 @@ def get_scene_info(examples_dir: str) -> List[Dict[str, Any]]:
 def cleanup_memory() -> None:
     """Clean up GPU memory and garbage collect."""
     gc.collect()
-    if torch.cuda.is_available():
+    if torch.cuda.is_available() and torch.cuda.is_initialized():
         torch.cuda.empty_cache()
 
 
@@ -129,6 +129,9 @@ def auto(
     ),
     # Video-specific options
     fps: float = typer.Option(1.0, help="[Video] Sampling FPS for frame extraction"),
+    frame_format: str = typer.Option(
+        "jpg", help="[Video] Format of extracted frames: 'jpg' (fast) or 'png' (lossless)"
+    ),
     # COLMAP-specific options
     sparse_subdir: str = typer.Option(
         "", help="[COLMAP] Sparse reconstruction subdirectory (e.g., '0' for sparse/0/)"
@@ -238,7 +241,7 @@ def auto(
         export_dir = InputHandler.handle_export_dir(export_dir, auto_cleanup)
 
         # Process input
-        image_files = VideoHandler.process(input_path, export_dir, fps)
+        image_files = VideoHandler.process(input_path, export_dir, fps, frame_format)
 
         # Run inference
         run_inference(
@@ -507,6 +510,9 @@ def colmap(
 def video(
     video_path: str = typer.Argument(..., help="Path to input video file"),
     fps: float = typer.Option(1.0, help="Sampling FPS for frame extraction"),
+    frame_format: str = typer.Option(
+        "jpg", help="Format of extracted frames: 'jpg' (fast) or 'png' (lossless)"
+    ),
     model_dir: str = typer.Option(DEFAULT_MODEL, help="Model directory path"),
     export_dir: str = typer.Option(DEFAULT_EXPORT_DIR, help="Export directory"),
     export_format: str = typer.Option("glb", help="Export format"),
@@ -544,7 +550,7 @@ def video(
     export_dir = InputHandler.handle_export_dir(export_dir, auto_cleanup)
 
     # Process input
-    image_files = VideoHandler.process(video_path, export_dir, fps)
+    image_files = VideoHandler.process(video_path, export_dir, fps, frame_format)
 
     # Parse export_feat parameter
     export_feat_layers = parse_export_feat(export_feat)
@@ -18,13 +18,17 @@ Model backend service for Depth Anything 3.
 Provides HTTP API for model inference with persistent model loading.
 """
 
+import asyncio
 import os
 import posixpath
+import shutil
+import threading
 import time
 import uuid
 import tempfile
 import io
 
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 from urllib.parse import quote
@@ -34,7 +38,15 @@ import cv2
 import uvicorn
 from fastapi import FastAPI, HTTPException, UploadFile, File, Form, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, HTMLResponse, StreamingResponse
+from fastapi.responses import FileResponse, HTMLResponse
+from starlette.background import BackgroundTask
+
+try:
+    # orjson (installed with the [app] extra) serializes large base64 payloads much faster
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as _JSONResponse
+except ImportError:
+    from fastapi.responses import JSONResponse as _JSONResponse
 from pydantic import BaseModel
 from PIL import Image
 
@@ -44,6 +56,9 @@ from ..utils.memory import (
     cleanup_cuda_memory,
     check_memory_availability,
     estimate_memory_requirement,
+    max_batch_for_memory,
+    record_measurement,
+    snapshot_peak,
 )
 from ..services.input_handlers import VideoHandler, ImageHandler
 
@@ -171,14 +186,17 @@ class ModelBackend:
 # Global backend instance
 _backend: Optional[ModelBackend] = None
 _app: Optional[FastAPI] = None
-_tasks: Dict[str, TaskStatus] = {}
+_tasks: "OrderedDict[str, TaskStatus]" = OrderedDict()  # Finished tasks move to the end
+_tasks_lock = threading.Lock()  # Guards insertion, removal, reordering and iteration of _tasks
 _executor = ThreadPoolExecutor(max_workers=1)  # Restrict to single-task execution
 _running_task_id: Optional[str] = None  # Currently running task ID
 _task_queue: List[str] = []  # Pending task queue
 
 # Task cleanup configuration
 MAX_TASK_HISTORY = 100  # Maximum number of tasks to keep in memory
-CLEANUP_INTERVAL = 300  # Cleanup interval in seconds (5 minutes)
+TASK_RETENTION = 600  # Seconds to keep completed/failed tasks (10 minutes)
+_cleanup_timer: Optional[threading.Timer] = None  # Fires when the next finished task expires
+_cleanup_lock = threading.Lock()
 
 
 def _process_next_task():
@@ -249,17 +267,22 @@ def _run_inference_task(task_id: str):
         if not mem_available:
             # Try aggressive cleanup
             print(f"[{task_id}] Insufficient memory, attempting aggressive cleanup...")
-            cleanup_cuda_memory()
+            cleanup_cuda_memory(force=True)
             time.sleep(0.5)  # Give system time to reclaim memory
 
             # Check again
             mem_available, mem_msg = check_memory_availability(estimated_memory)
             if not mem_available:
+                max_batch = max_batch_for_memory(request.process_res)
+                if max_batch > 0:
+                    batch_hint = f"Process at most {max_batch} images at once"
+                else:
+                    batch_hint = "Not even one image fits in free memory at this resolution"
                 raise RuntimeError(
                     f"Insufficient GPU memory after cleanup. {mem_msg}\n"
                     f"Suggestions:\n"
                     f"  1. Reduce process_res (current: {request.process_res})\n"
-                    f"  2. Process fewer images at once (current: {num_images})\n"
+                    f"  2. {batch_hint} (current: {num_images} images)\n"
                     f"  3. Clear other GPU processes"
                 )
 
@@ -272,7 +295,7 @@ def _run_inference_task(task_id: str):
             model = _backend.get_model()
         except RuntimeError as e:
             if "out of memory" in str(e).lower():
-                cleanup_cuda_memory()
+                cleanup_cuda_memory(force=True)
                 raise RuntimeError(
                     f"OOM during model loading: {str(e)}\n"
                     f"Try reducing the batch size or resolution."
@@ -312,12 +335,29 @@ def _run_inference_task(task_id: str):
         _tasks[task_id].progress = 0.3
 
         inference_started = True
+        # Start a fresh peak window so the snapshot below covers this inference only;
+        # memory allocated now (model weights) is the baseline of that window
+        window = snapshot_peak()
 
         try:
             model.inference(**inference_kwargs)
             inference_time = time.time() - inference_start_time
             avg_time_per_image = inference_time / num_images if num_images > 0 else 0
 
+            # Calibrate future memory estimates with the measured working set
+            peak = snapshot_peak()
+            if peak is not None:
+                print(
+                    f"[{task_id}] Peak GPU memory: {peak['peak_allocated_gb']:.2f}GB allocated, "
+                    f"{peak['peak_reserved_gb']:.2f}GB reserved"
+                )
+                if window is not None:
+                    record_measurement(
+                        num_images,
+                        request.process_res,
+                        peak["peak_allocated_gb"] - window["allocated_gb"],
+                    )
+
             print(
                 f"[{task_id}] Inference completed in {inference_time:.2f}s "
                 f"({avg_time_per_image:.2f}s per image)"
@@ -325,7 +365,7 @@ def _run_inference_task(task_id: str):
 
         except RuntimeError as e:
             if "out of memory" in str(e).lower():
-                cleanup_cuda_memory()
+                cleanup_cuda_memory(force=True)
                 raise RuntimeError(
                     f"OOM during inference: {str(e)}\n"
                     f"Settings: {num_images} images, resolution={request.process_res}\n"
@@ -348,6 +388,8 @@ def _run_inference_task(task_id: str):
         # Update task status to completed
         _tasks[task_id].status = "completed"
         _tasks[task_id].completed_at = time.time()
+        with _tasks_lock:
+            _tasks.move_to_end(task_id)
         _tasks[task_id].message = (
             f"[{task_id}] Completed in {total_time:.2f}s " f"({avg_time_per_image:.2f}s per image)"
         )
@@ -375,10 +417,12 @@ def _run_inference_task(task_id: str):
         print(f"[{task_id}] Task failed after {total_time:.2f}s: {error_msg}")
 
         # Always attempt cleanup on failure
-        cleanup_cuda_memory()
+        cleanup_cuda_memory(force=True)
 
         _tasks[task_id].status = "failed"
         _tasks[task_id].completed_at = time.time()
+        with _tasks_lock:
+            _tasks.move_to_end(task_id)
         _tasks[task_id].message = f"[{task_id}] Failed after {total_time:.2f}s: {error_msg}"
 
         # Clear running state
@@ -402,62 +446,79 @@ def _run_inference_task(task_id: str):
 
 
 def _cleanup_old_tasks():
-    """Clean up old completed/failed tasks to prevent memory buildup."""
+    """Clean up old completed/failed tasks to prevent memory buildup.
+
+    Tasks are moved to the end of ``_tasks`` when they finish, so finished tasks
+    are visited oldest first and the sweep stops at the first one worth keeping.
+    """
     global _tasks
 
     current_time = time.time()
     tasks_to_remove = []
 
-    # Find tasks to remove - more aggressive cleanup
-    for task_id, task in _tasks.items():
-        # Remove completed/failed tasks older than 10 minutes (instead of 1 hour)
-        if (
-            task.status in ["completed", "failed"]
-            and task.completed_at
-            and current_time - task.completed_at > 600
-        ):  # 10 minutes
+    with _tasks_lock:
+        excess_count = len(_tasks) - MAX_TASK_HISTORY
+        for task_id, task in _tasks.items():
+            if task.status not in ["completed", "failed"]:
+                continue
+            # Remove completed/failed tasks older than TASK_RETENTION, then the oldest
+            # remaining ones while there are more than MAX_TASK_HISTORY tasks
+            expired = task.completed_at and current_time - task.completed_at > TASK_RETENTION
+            if not expired and len(tasks_to_remove) >= excess_count:
+                break
             tasks_to_remove.append(task_id)
 
-    # Remove old tasks
-    for task_id in tasks_to_remove:
-        del _tasks[task_id]
-        print(f"[CLEANUP] Removed old task: {task_id}")
-
-    # If still too many tasks, remove oldest completed/failed tasks
-    if len(_tasks) > MAX_TASK_HISTORY:
-        completed_tasks = [
-            (task_id, task)
-            for task_id, task in _tasks.items()
-            if task.status in ["completed", "failed"]
-        ]
-        completed_tasks.sort(key=lambda x: x[1].completed_at or 0)
-
-        excess_count = len(_tasks) - MAX_TASK_HISTORY
-        for i in range(min(excess_count, len(completed_tasks))):
-            task_id = completed_tasks[i][0]
+        for task_id in tasks_to_remove:
             del _tasks[task_id]
-            print(f"[CLEANUP] Removed excess task: {task_id}")
 
-    # Count active tasks (only pending and running)
-    active_count = sum(1 for task in _tasks.values() if task.status in ["pending", "running"])
+        total_count = len(_tasks)
+        # Count active tasks (only pending and running)
+        active_count = sum(1 for task in _tasks.values() if task.status in ["pending", "running"])
+
+    for task_id in tasks_to_remove:
+        print(f"[CLEANUP] Removed old task: {task_id}")
     print(
         "[CLEANUP] Task cleanup completed. "
-        f"Total tasks: {len(_tasks)}, Active tasks: {active_count}"
+        f"Total tasks: {total_count}, Active tasks: {active_count}"
     )
 
 
 def _schedule_task_cleanup():
-    """Schedule task cleanup in background."""
+    """Clean up tasks now and arm a timer for the next finished task to expire.
+
+    A single timer tracks the earliest expiry instead of polling, so nothing wakes
+    up while there are no finished tasks, and the inference executor is not used.
+    """
+    global _cleanup_timer
+
+    with _cleanup_lock:
+        if _cleanup_timer is not None:
+            _cleanup_timer.cancel()
+            _cleanup_timer = None
 
-    def cleanup_worker():
         try:
-            time.sleep(2)  # Small delay to ensure task status is updated
             _cleanup_old_tasks()
+
+            # Finished tasks are kept in completion order, so the first one expires next
+            with _tasks_lock:
+                next_expiry = next(
+                    (
+                        task.completed_at + TASK_RETENTION
+                        for task in _tasks.values()
+                        if task.status in ["completed", "failed"] and task.completed_at
+                    ),
+                    None,
+                )
         except Exception as e:
-            print(f"[CLEANUP] Cleanup worker failed: {e}")
+            print(f"[CLEANUP] Cleanup failed: {e}")
+            # Retry one retention period later rather than leaving finished tasks unswept
+            next_expiry = time.time() + TASK_RETENTION
 
-    # Run cleanup in background thread
-    _executor.submit(cleanup_worker)
+        if next_expiry is not None:
+            delay = max(0.0, next_expiry - time.time()) + 1.0
+            _cleanup_timer = threading.Timer(delay, _schedule_task_cleanup)
+            _cleanup_timer.daemon = True
+            _cleanup_timer.start()
 
 
 # ============================================================================
@@ -868,11 +929,11 @@ def create_app(model_dir: str, device: str = "cuda", gallery_dir: Optional[str]
         else:
             uptime_str = "Not running"
 
-        # Get tasks information
-        active_tasks = [task for task in _tasks.values() if task.status in ["pending", "running"]]
-        completed_tasks = [
-            task for task in _tasks.values() if task.status in ["completed", "failed"]
-        ]
+        # Get tasks information from a snapshot; worker threads reorder _tasks
+        with _tasks_lock:
+            tasks = list(_tasks.values())
+        active_tasks = [task for task in tasks if task.status in ["pending", "running"]]
+        completed_tasks = [task for task in tasks if task.status in ["completed", "failed"]]
 
         # Generate task HTML
         active_tasks_html = ""
@@ -1125,7 +1186,7 @@ def create_app(model_dir: str, device: str = "cuda", gallery_dir: Optional[str]
                 </div>
                 <div class="status-item">
                     <span>Total Tasks:</span>
-                    <span class="status-value">{len(_tasks)}</span>
+                    <span class="status-value">{len(tasks)}</span>
                 </div>
             </div>
         </div>
@@ -1205,7 +1266,7 @@ def create_app(model_dir: str, device: str = "cuda", gallery_dir: Optional[str]
             raise HTTPException(status_code=500, detail="Backend not initialized")
 
         # Generate unique task ID
-        task_id = str(uuid.uuid4())
+        task_id = uuid.uuid4().hex
 
         # Create task status
         if _running_task_id is not None:
@@ -1213,7 +1274,7 @@ def create_app(model_dir: str, device: str = "cuda", gallery_dir: Optional[str]
         else:
             status_msg = f"[{task_id}] Task submitted"
 
-        _tasks[task_id] = TaskStatus(
+        task = TaskStatus(
             task_id=task_id,
             status="pending",
             message=status_msg,
@@ -1228,6 +1289,8 @@ def create_app(model_dir: str, device: str = "cuda", gallery_dir: Optional[str]
                 request.image_paths[0] if request.image_paths else None
             ),  # Use first image path as video reference
         )
+        with _tasks_lock:
+            _tasks[task_id] = task
 
         # Add task to queue
         _task_queue.append(task_id)
@@ -1269,18 +1332,28 @@ def create_app(model_dir: str, device: str = "cuda", gallery_dir: Optional[str]
             raise HTTPException(status_code=500, detail="Backend not initialized")
 
         try:
-            # Create temporary directory for processing
-            with tempfile.TemporaryDirectory() as temp_dir:
+            # Create temporary directory for processing; it is removed off the
+            # event loop so deleting many frames does not stall other requests
+            temp_dir = tempfile.mkdtemp()
+            # Set once a FileResponse takes over removing temp_dir after sending
+            temp_dir_handed_off = False
+            try:
                 processed_images = []
-                
-                for file in files:
-                    file_path = os.path.join(temp_dir, file.filename)
-                    
-                    # Save uploaded file
-                    with open(file_path, "wb") as f:
-                        content = await file.read()
-                        f.write(content)
-                    
+
+                # Save all uploads in one worker thread; UploadFile is already
+                # spooled, so copy it in chunks rather than reading it whole
+                def save_uploads():
+                    paths = []
+                    for file in files:
+                        file_path = os.path.join(temp_dir, file.filename)
+                        with open(file_path, "wb") as f:
+                            shutil.copyfileobj(file.file, f, 1024 * 1024)
+                        paths.append(file_path)
+                    return paths
+
+                file_paths = await asyncio.to_thread(save_uploads)
+
+                for file, file_path in zip(files, file_paths):
                     # Check file type and process
                     if file.filename.lower().endswith(('.mp4', '.avi', '.mov', '.mkv', '.flv', '.wmv', '.webm', '.m4v')):
                         # Video file - extract frames
@@ -1417,7 +1490,6 @@ def create_app(model_dir: str, device: str = "cuda", gallery_dir: Optional[str]
                 # If output_format is 'json' or include_metadata is True, return JSON with metadata
                 if output_format == "json" or include_metadata:
                     import base64
-                    from fastapi.responses import JSONResponse
 
                     metadata = extract_metadata(prediction)
 
@@ -1429,7 +1501,7 @@ def create_app(model_dir: str, device: str = "cuda", gallery_dir: Optional[str]
                     metadata["model_size_bytes"] = len(glb_data)
 
                     cleanup_cuda_memory()
-                    return JSONResponse(content=metadata)
+                    return _JSONResponse(content=metadata)
 
                 # If output_format is 'ply', convert GLB to PLY
                 elif output_format == "ply":
@@ -1437,30 +1509,30 @@ def create_app(model_dir: str, device: str = "cuda", gallery_dir: Optional[str]
                     ply_path = os.path.join(temp_dir, "output.ply")
                     mesh = trimesh.load(glb_path, file_type="glb")
                     mesh.export(ply_path, file_type="ply")
-                    with open(ply_path, "rb") as f:
-                        ply_data = f.read()
                     cleanup_cuda_memory()
-                    def generate():
-                        yield ply_data
-                    return StreamingResponse(
-                        generate(),
+                    # Stream from disk in chunks; temp_dir is removed once the file is sent
+                    temp_dir_handed_off = True
+                    return FileResponse(
+                        ply_path,
                         media_type="application/octet-stream",
-                        headers={"Content-Disposition": "attachment; filename=output.ply"}
+                        filename="output.ply",
+                        background=BackgroundTask(shutil.rmtree, temp_dir, ignore_errors=True),
                     )
                 else:
-                    with open(glb_path, "rb") as f:
-                        glb_data = f.read()
                     cleanup_cuda_memory()
-                    def generate():
-                        yield glb_data
-                    return StreamingResponse(
-                        generate(),
+                    temp_dir_handed_off = True
+                    return FileResponse(
+                        glb_path,
                         media_type="model/gltf-binary",
-                        headers={"Content-Disposition": "attachment; filename=output.glb"}
+                        filename="output.glb",
+                        background=BackgroundTask(shutil.rmtree, temp_dir, ignore_errors=True),
                     )
-                
+            finally:
+                if not temp_dir_handed_off:
+                    await asyncio.to_thread(shutil.rmtree, temp_dir, ignore_errors=True)
+
         except Exception as e:
-            cleanup_cuda_memory()
+            cleanup_cuda_memory(force=True)
             raise HTTPException(status_code=500, detail=f"Processing failed: {str(e)}")
 
     @_app.get("/task/{task_id}", response_model=TaskStatus)
@@ -1498,25 +1570,31 @@ def create_app(model_dir: str, device: str = "cuda", gallery_dir: Optional[str]
     @_app.get("/tasks")
     async def list_tasks():
         """List all tasks."""
+        with _tasks_lock:
+            tasks = list(_tasks.values())
+
         # Separate active and completed tasks
-        active_tasks = [task for task in _tasks.values() if task.status in ["pending", "running"]]
-        completed_tasks = [
-            task for task in _tasks.values() if task.status in ["completed", "failed"]
-        ]
+        active_tasks = [task for task in tasks if task.status in ["pending", "running"]]
+        completed_tasks = [task for task in tasks if task.status in ["completed", "failed"]]
 
         return {
-            "tasks": list(_tasks.values()),
+            "tasks": tasks,
             "active_tasks": active_tasks,
             "completed_tasks": completed_tasks,
             "active_count": len(active_tasks),
-            "total_count": len(_tasks),
+            "total_count": len(tasks),
         }
 
     @_app.post("/cleanup")
     async def manual_cleanup():
         """Manually trigger task cleanup."""
+        def sweep():
+            with _cleanup_lock:
+                _cleanup_old_tasks()
+
         try:
-            _cleanup_old_tasks()
+            # The locks can be held by the worker thread; wait for them off the event loop
+            await asyncio.to_thread(sweep)
             return {"message": "Cleanup completed", "active_tasks": len(_tasks)}
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Cleanup failed: {str(e)}")
@@ -1524,14 +1602,17 @@ def create_app(model_dir: str, device: str = "cuda", gallery_dir: Optional[str]
     @_app.delete("/task/{task_id}")
     async def delete_task(task_id: str):
         """Delete a specific task."""
-        if task_id not in _tasks:
-            raise HTTPException(status_code=404, detail="Task not found")
+        with _tasks_lock:
+            if task_id not in _tasks:
+                raise HTTPException(status_code=404, detail="Task not found")
 
-        # Only allow deletion of completed/failed tasks
-        if _tasks[task_id].status not in ["completed", "failed"]:
-            raise HTTPException(status_code=400, detail="Cannot delete running or pending tasks")
+            # Only allow deletion of completed/failed tasks
+            if _tasks[task_id].status not in ["completed", "failed"]:
+                raise HTTPException(
+                    status_code=400, detail="Cannot delete running or pending tasks"
+                )
 
-        del _tasks[task_id]
+            del _tasks[task_id]
         return {"message": f"Task {task_id} deleted successfully"}
 
     @_app.post("/reload")
@@ -32,6 +32,8 @@ class InferenceService:
         self.model_dir = model_dir
         self.device = device
         self.model = None
+        # Keep-alive session so the status check and task submission share a connection
+        self.http = requests.Session()
 
     def load_model(self):
         """Load model"""
@@ -141,7 +143,7 @@ class InferenceService:
         # Submit task
         typer.echo("Submitting inference task to backend...")
         try:
-            response = requests.post(f"{backend_url}/inference", json=payload, timeout=30)
+            response = self.http.post(f"{backend_url}/inference", json=payload, timeout=30)
             response.raise_for_status()
             result = response.json()
 
@@ -162,7 +164,7 @@ class InferenceService:
     def _check_backend_status(self, backend_url: str) -> bool:
         """Check backend status"""
         try:
-            response = requests.get(f"{backend_url}/status", timeout=5)
+            response = self.http.get(f"{backend_url}/status", timeout=5)
             return response.status_code == 200
         except Exception:
             return False
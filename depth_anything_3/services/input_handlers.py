@@ -25,6 +25,7 @@ import numpy as np
 import typer
 
 from ..utils.read_write_model import read_model
+from ..utils.video import FRAME_WRITE_PARAMS, extract_video_frames
 
 
 class InputHandler:
@@ -188,9 +189,15 @@ class VideoHandler(InputHandler):
     """Video handler"""
 
     @staticmethod
-    def process(video_path: str, output_dir: str, fps: float = 1.0) -> List[str]:
-        """Process video, extract frames"""
+    def process(
+        video_path: str, output_dir: str, fps: float = 1.0, frame_format: str = "png"
+    ) -> List[str]:
+        """Process video, extract frames (frame_format: "png" or "jpg")"""
         InputHandler.validate_path(video_path, "Video file")
+        if frame_format not in FRAME_WRITE_PARAMS:
+            raise typer.BadParameter(
+                f"Unsupported frame format: {frame_format}. Use one of {list(FRAME_WRITE_PARAMS)}"
+            )
 
         cap = cv2.VideoCapture(video_path)
         if not cap.isOpened():
@@ -224,22 +231,10 @@ class VideoHandler(InputHandler):
         frames_dir = os.path.join(output_dir, "input_images")
         os.makedirs(frames_dir, exist_ok=True)
 
-        frame_count = 0
-        saved_count = 0
-
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                break
-
-            if frame_count % frame_interval == 0:
-                frame_path = os.path.join(frames_dir, f"{saved_count:06d}.png")
-                cv2.imwrite(frame_path, frame)
-                saved_count += 1
-
-            frame_count += 1
-
         cap.release()
+        saved_count = len(
+            extract_video_frames(video_path, frames_dir, frame_interval, frame_format=frame_format)
+        )
         typer.echo(f"Extracted {saved_count} frames to {frames_dir}")
 
         # Get frame file list
@@ -220,36 +220,38 @@ def _depths_to_world_points_with_colors(
     ones = np.ones_like(us)
     pix = np.stack([us, vs, ones], axis=-1).reshape(-1, 3)  # (H*W,3)
 
-    pts_all, col_all = [], []
+    # Count valid pixels first so the outputs are allocated once and filled in place,
+    # instead of holding per-frame arrays plus their concatenated copy
+    valid_all = np.isfinite(depth) & (depth > 0)
+    if conf is not None:
+        valid_all &= conf >= conf_thr
+    valid_all = valid_all.reshape(N, -1)
+    total = int(valid_all.sum())
+
+    pts_out = np.empty((total, 3), dtype=np.float32)
+    col_out = np.empty((total, 3), dtype=np.uint8)
+    fill = 0
 
     for i in range(N):
-        d = depth[i]  # (H,W)
-        valid = np.isfinite(d) & (d > 0)
-        if conf is not None:
-            valid &= conf[i] >= conf_thr
-        if not np.any(valid):
+        vidx = np.flatnonzero(valid_all[i])
+        if vidx.size == 0:
             continue
 
-        d_flat = d.reshape(-1)
-        vidx = np.flatnonzero(valid.reshape(-1))
+        d_flat = depth[i].reshape(-1)
 
         K_inv = np.linalg.inv(K[i])  # (3,3)
         c2w = np.linalg.inv(_as_homogeneous44(ext_w2c[i]))  # (4,4)
 
         rays = K_inv @ pix[vidx].T  # (3,M)
         Xc = rays * d_flat[vidx][None, :]  # (3,M)
-        Xc_h = np.vstack([Xc, np.ones((1, Xc.shape[1]))])
-        Xw = (c2w @ Xc_h)[:3].T.astype(np.float32)  # (M,3)
+        Xw = (c2w[:3, :3] @ Xc + c2w[:3, 3:]).T  # (M,3)
 
-        cols = images_u8[i].reshape(-1, 3)[vidx].astype(np.uint8)  # (M,3)
+        end = fill + vidx.size
+        pts_out[fill:end] = Xw
+        col_out[fill:end] = images_u8[i].reshape(-1, 3)[vidx]
+        fill = end
 
-        pts_all.append(Xw)
-        col_all.append(cols)
-
-    if len(pts_all) == 0:
-        return np.zeros((0, 3), dtype=np.float32), np.zeros((0, 3), dtype=np.uint8)
-
-    return np.concatenate(pts_all, 0), np.concatenate(col_all, 0)
+    return pts_out, col_out
 
 
 def _filter_and_downsample(points: np.ndarray, colors: np.ndarray, num_max: int):
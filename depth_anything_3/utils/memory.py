@@ -1,18 +1,84 @@
 """GPU memory helper utilities used by the backend service.
 
 Provides lightweight implementations for:
+- configure_cuda_allocator()
 - get_gpu_memory_info()
 - cleanup_cuda_memory()
 - check_memory_availability(required_gb)
 - estimate_memory_requirement(num_images, process_res)
+- snapshot_peak()
+- record_measurement(num_images, process_res, working_set_gb)
+- max_batch_for_memory(process_res)
 
 These functions are intentionally conservative and have no external
 runtime dependencies other than torch (optional). They fall back to
 CPU-only behavior when CUDA is unavailable.
 """
 
+import atexit
 import gc
-from typing import Dict, Optional, Tuple
+import json
+import os
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+# NVML is initialized once per process and the device handle reused across calls
+_NVML_INITED = False
+_NVML_HANDLE: Optional[Any] = None
+_NVML_LOCK = threading.Lock()
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a float from the environment, falling back to ``default`` if unset or malformed."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        print(f"Ignoring invalid {name}={value!r}; using {default}")
+        return default
+
+
+# cleanup_cuda_memory() only releases cached blocks once the caching allocator
+# has reserved more than this fraction of device memory (unless forced)
+EMPTY_CACHE_THRESHOLD = _env_float("DA3_EMPTY_CACHE_THRESHOLD", 0.8)
+
+# Measured per-image memory, keyed by "<device name>@<process_res>", persisted
+# across restarts and updated with an exponential moving average
+CALIBRATION_PATH = os.path.join(os.path.expanduser("~"), ".cache", "da3", "mem_calib.json")
+_CALIBRATION_EMA = 0.3
+_calibration: Optional[Dict[str, float]] = None
+_calibration_epoch = 0  # Bumped on every update; part of the estimate cache key
+_CALIBRATION_LOCK = threading.Lock()
+_DEVICE_NAME: Optional[str] = None  # Set by _device_name() once CUDA is initialized
+
+# Heuristic used when no measurement exists for the device/resolution
+_PER_IMAGE_AT_504_GB = 0.6
+_OVERHEAD_GB = 1.0
+
+
+def configure_cuda_allocator(expandable: bool = True, max_split_mb: Optional[int] = 512) -> None:
+    """Default the PyTorch CUDA caching allocator to expandable segments.
+
+    Expandable segments grow one virtual mapping instead of carving fixed-size
+    blocks, which avoids the reserved-but-unusable fragmentation behind most OOMs
+    on long-running servers. A PYTORCH_CUDA_ALLOC_CONF set by the user is kept.
+
+    Must run before the first CUDA allocation: the allocator reads the setting once.
+    """
+    options = []
+    if expandable:
+        options.append("expandable_segments:True")
+    if max_split_mb:
+        options.append(f"max_split_size_mb:{max_split_mb}")
+    if options:
+        os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", ",".join(options))
+
+
+# Applied on import so every entry point using these helpers gets the same policy
+configure_cuda_allocator()
 
 
 def _safe_import_torch():
@@ -24,6 +90,30 @@ def _safe_import_torch():
         return None
 
 
+def _get_nvml_handle():
+    """Return the cached NVML handle for device 0, or None if pynvml is unusable.
+
+    Initialization is attempted only once; shutdown is registered with atexit.
+    """
+    global _NVML_INITED, _NVML_HANDLE
+    if _NVML_INITED:
+        return _NVML_HANDLE
+
+    with _NVML_LOCK:
+        if not _NVML_INITED:
+            try:
+                import pynvml
+
+                pynvml.nvmlInit()
+                _NVML_HANDLE = pynvml.nvmlDeviceGetHandleByIndex(0)
+                atexit.register(pynvml.nvmlShutdown)
+            except Exception:
+                # pynvml not installed or no NVIDIA driver
+                _NVML_HANDLE = None
+            _NVML_INITED = True
+    return _NVML_HANDLE
+
+
 def get_gpu_memory_info() -> Optional[Dict[str, float]]:
     """Return basic GPU memory statistics.
 
@@ -37,8 +127,8 @@ def get_gpu_memory_info() -> Optional[Dict[str, float]]:
     try:
         # Use device 0 as representative device
         dev = torch.device("cuda:0")
-        props = torch.cuda.get_device_properties(dev)
-        total_bytes = props.total_memory
+        # Driver-level numbers also account for memory held by other processes
+        free_bytes, total_bytes = torch.cuda.mem_get_info(dev)
 
         allocated = torch.cuda.memory_allocated(dev)
         reserved = torch.cuda.memory_reserved(dev)
@@ -46,21 +136,19 @@ def get_gpu_memory_info() -> Optional[Dict[str, float]]:
         total_gb = total_bytes / (1024 ** 3)
         allocated_gb = allocated / (1024 ** 3)
         reserved_gb = reserved / (1024 ** 3)
-        free_gb = max(total_gb - reserved_gb, 0.0)
+        # Blocks cached by this process's allocator are reusable without the driver
+        free_gb = (free_bytes + max(reserved - allocated, 0)) / (1024 ** 3)
 
         # Try to get utilization via pynvml if installed, otherwise leave as 0.0
         utilization = 0.0
-        try:
-            import pynvml
+        handle = _get_nvml_handle()
+        if handle is not None:
+            try:
+                import pynvml
 
-            pynvml.nvmlInit()
-            handle = pynvml.nvmlDeviceGetHandleByIndex(0)
-            util = pynvml.nvmlDeviceGetUtilizationRates(handle)
-            utilization = float(util.gpu)
-            pynvml.nvmlShutdown()
-        except Exception:
-            # ignore if pynvml not available
-            pass
+                utilization = float(pynvml.nvmlDeviceGetUtilizationRates(handle).gpu)
+            except Exception:
+                pass
 
         return {
             "total_gb": total_gb,
@@ -73,19 +161,42 @@ def get_gpu_memory_info() -> Optional[Dict[str, float]]:
         return None
 
 
-def cleanup_cuda_memory() -> None:
+def cleanup_cuda_memory(force: bool = False) -> None:
     """Attempt to free GPU memory and run garbage collection.
 
-    This is safe to call on CPU-only systems.
+    ``empty_cache`` scans the whole allocator pool and makes later allocations
+    go back to cudaMalloc, so by default both it and ``gc.collect`` only run
+    when reserved memory exceeds EMPTY_CACHE_THRESHOLD of the device total
+    (env: DA3_EMPTY_CACHE_THRESHOLD). Pass ``force=True`` to always clean up,
+    e.g. after an OOM.
+
+    This is safe to call on CPU-only systems, and never initializes CUDA:
+    in a process that has not touched the GPU (e.g. the Gradio main process
+    on ZeroGPU Spaces, where inference runs in a spaces.GPU worker) it only
+    runs garbage collection, and only when forced.
     """
-    gc.collect()
     torch = _safe_import_torch()
-    if torch is None:
+    cuda_ready = False
+    try:
+        cuda_ready = (
+            torch is not None and torch.cuda.is_available() and torch.cuda.is_initialized()
+        )
+        if cuda_ready and not force:
+            reserved = torch.cuda.memory_reserved(0)
+            total = torch.cuda.get_device_properties(0).total_memory
+            force = reserved / total > EMPTY_CACHE_THRESHOLD
+    except Exception:
+        pass
+
+    if not force:
+        return
+
+    gc.collect()
+    if not cuda_ready:
         return
 
     try:
-        if torch.cuda.is_available():
-            torch.cuda.empty_cache()
+        torch.cuda.empty_cache()
     except Exception:
         # Don't fail callers if cleanup fails
         pass
@@ -109,6 +220,105 @@ def check_memory_availability(required_gb: float) -> Tuple[bool, str]:
     return False, f"Insufficient GPU memory: required={required_gb:.2f}GB free={free:.2f}GB total={total:.2f}GB"
 
 
+def _device_name() -> Optional[str]:
+    """Name of CUDA device 0, or None if CUDA has not been initialized in this process.
+
+    The name is looked up once and then reused, since the device does not change
+    within a process. None is not cached, so the lookup is retried until CUDA is up.
+    """
+    global _DEVICE_NAME
+    if _DEVICE_NAME is None:
+        torch = _safe_import_torch()
+        try:
+            if torch is not None and torch.cuda.is_available() and torch.cuda.is_initialized():
+                _DEVICE_NAME = torch.cuda.get_device_name(0)
+        except Exception:
+            pass
+    return _DEVICE_NAME
+
+
+def _load_calibration() -> Dict[str, float]:
+    """Return the calibration table, reading CALIBRATION_PATH on first use."""
+    global _calibration
+    if _calibration is None:
+        try:
+            with open(CALIBRATION_PATH, "r", encoding="utf-8") as f:
+                _calibration = {k: float(v) for k, v in json.load(f).items()}
+        except Exception:
+            _calibration = {}
+    return _calibration
+
+
+def snapshot_peak(device: int = 0) -> Optional[Dict[str, float]]:
+    """Return peak GPU memory since the previous snapshot, then reset the peak counters.
+
+    Returns a dict with keys peak_allocated_gb, peak_reserved_gb and allocated_gb,
+    or None if CUDA has not been initialized in this process. allocated_gb is the
+    memory allocated at the reset, i.e. the baseline of the next window (model
+    weights and other resident tensors). All reads are cheap counter lookups.
+    """
+    torch = _safe_import_torch()
+    try:
+        if torch is None or not torch.cuda.is_available() or not torch.cuda.is_initialized():
+            return None
+
+        peak = {
+            "peak_allocated_gb": torch.cuda.max_memory_allocated(device) / (1024 ** 3),
+            "peak_reserved_gb": torch.cuda.max_memory_reserved(device) / (1024 ** 3),
+            "allocated_gb": torch.cuda.memory_allocated(device) / (1024 ** 3),
+        }
+        torch.cuda.reset_peak_memory_stats(device)
+        return peak
+    except Exception:
+        return None
+
+
+def record_measurement(num_images: int, process_res: int, working_set_gb: float) -> None:
+    """Fold a measured inference working set into the per-device calibration table.
+
+    ``working_set_gb`` is the peak allocated memory of one inference minus the
+    memory already allocated when its window started (see snapshot_peak), so
+    resident model weights are excluded; it is attributed evenly to the images.
+    """
+    global _calibration_epoch
+    name = _device_name()
+    if name is None or num_images <= 0:
+        return
+
+    per_image = max(working_set_gb, 0.0) / num_images
+    key = f"{name}@{process_res}"
+
+    with _CALIBRATION_LOCK:
+        _calibration_epoch += 1
+        table = _load_calibration()
+        previous = table.get(key)
+        if previous is None:
+            table[key] = per_image
+        else:
+            table[key] = previous + _CALIBRATION_EMA * (per_image - previous)
+
+        try:
+            os.makedirs(os.path.dirname(CALIBRATION_PATH), exist_ok=True)
+            tmp_path = CALIBRATION_PATH + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(table, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, CALIBRATION_PATH)
+        except OSError:
+            # Calibration is an optimization; keep the in-memory table only
+            pass
+
+
+def _per_image_gb(process_res: int, name: Optional[str]) -> float:
+    """Per-image memory in GB: calibrated for device ``name`` if measured, else heuristic."""
+    if name is not None:
+        per_image = _load_calibration().get(f"{name}@{process_res}")
+        if per_image is not None:
+            return per_image
+
+    scale = (process_res / 504) ** 2 if process_res > 0 else 1.0
+    return _PER_IMAGE_AT_504_GB * scale
+
+
 def estimate_memory_requirement(num_images: int, process_res: int = 504) -> float:
     """Estimate GPU memory requirement (in GB) for a job.
 
@@ -116,19 +326,44 @@ def estimate_memory_requirement(num_images: int, process_res: int = 504) -> floa
     with the number of images and the square of the processing resolution.
 
     - Base minimum memory: 1.0 GB
-    - Per-image memory at 504 px: ~0.6 GB
-    - Scale per-image by (process_res / 504)^2
+    - Per-image memory: measured value for this device and resolution from the
+      calibration table (see record_measurement), else ~0.6 GB at 504 px
+      scaled by (process_res / 504)^2
     """
+    return _estimate_memory_requirement(
+        num_images, process_res, _device_name(), _calibration_epoch
+    )
+
+
+@lru_cache(maxsize=256)
+def _estimate_memory_requirement(
+    num_images: int, process_res: int, name: Optional[str], epoch: int
+) -> float:
+    """Memoized body of estimate_memory_requirement; ``epoch`` invalidates on recalibration."""
     if num_images <= 0:
         return 1.0
 
-    per_image_at_504_gb = 0.6
-    scale = (process_res / 504) ** 2 if process_res > 0 else 1.0
-    per_image = per_image_at_504_gb * scale
-
     # Add an overhead for model parameters and buffers
-    overhead_gb = 1.0
-
-    estimated = overhead_gb + num_images * per_image
+    estimated = _OVERHEAD_GB + num_images * _per_image_gb(process_res, name)
     # Clamp to a reasonable minimum
     return max(estimated, 1.0)
+
+
+def max_batch_for_memory(process_res: int = 504, safety: float = 0.9) -> int:
+    """Largest number of images estimated to fit in the currently free GPU memory.
+
+    Inverts estimate_memory_requirement against ``safety`` times the free memory
+    reported by get_gpu_memory_info. Returns 0 if CUDA is unavailable or not even
+    one image fits.
+    """
+    info = get_gpu_memory_info()
+    if info is None:
+        return 0
+
+    budget = info["free_gb"] * safety - _OVERHEAD_GB
+    per_image = _per_image_gb(process_res, _device_name())
+    if budget <= 0 or budget < per_image:
+        return 0
+    if per_image <= 0:
+        return 1
+    return int(budget / per_image)